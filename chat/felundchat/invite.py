@@ -1,11 +1,16 @@
 from __future__ import annotations
 
 import base64
+import functools
 import json
+import re
 from typing import Tuple
 
 from felundchat.transport import parse_hostport
 
+# "felund1." + URL-safe base64 of the JSON payload (padding normally stripped).
+_FELUND_CODE_RE = re.compile(r"felund1\.[A-Za-z0-9_-]+={0,2}")
+
 
 def make_felund_code(secret_hex: str, peer_addr: str) -> str:
     payload = {"v": 1, "secret": secret_hex, "peer": peer_addr}
@@ -22,10 +27,17 @@ def is_relay_url(peer: str) -> bool:
     return peer.startswith(("http://", "https://", "//"))
 
 
+def looks_like_felund_code(code: str) -> bool:
+    """Cheap structural check: prefix and base64url alphabet, no decoding."""
+    return _FELUND_CODE_RE.fullmatch(code.strip()) is not None
+
+
 def parse_felund_code(code: str) -> Tuple[str, str]:
     code = code.strip()
     if not code.startswith("felund1."):
         raise ValueError("Invalid code prefix")
+    if not _FELUND_CODE_RE.fullmatch(code):
+        raise ValueError("Invalid code format")
     token = code.split(".", 1)[1]
     padding = "=" * (-len(token) % 4)
     raw = base64.urlsafe_b64decode((token + padding).encode("ascii"))
@@ -43,3 +55,12 @@ def parse_felund_code(code: str) -> Tuple[str, str]:
     if peer_addr and not is_relay_url(peer_addr):
         parse_hostport(peer_addr)
     return secret_hex, peer_addr
+
+
+@functools.lru_cache(maxsize=64)
+def parse_felund_code_cached(code: str) -> Tuple[str, str]:
+    """Memoized :func:`parse_felund_code`; re-pasting the same code is free.
+
+    Invalid codes still raise on every call (exceptions are not cached).
+    """
+    return parse_felund_code(code)
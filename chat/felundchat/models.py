@@ -88,6 +88,16 @@ class Channel:
     key_hash: str = ""
 
 
+@dataclasses.dataclass(frozen=True)
+class CircleView:
+    """Per-circle channel maps, backed by the same dicts held in ``State``."""
+    __slots__ = ("channels", "members", "requests")
+
+    channels: Dict[str, Channel]        # channel_id -> Channel
+    members: Dict[str, Set[str]]        # channel_id -> member node_ids
+    requests: Dict[str, Set[str]]       # channel_id -> pending node_ids
+
+
 @dataclasses.dataclass
 class State:
     node: NodeConfig
@@ -106,6 +116,17 @@ class State:
         default_factory=dict
     )  # session_id -> CallSession (ephemeral — not persisted)
 
+    def circle_view(self, circle_id: str) -> CircleView:
+        """Return the channel maps for *circle_id*.
+
+        Callers must have run ``ensure_default_channel`` for the circle first.
+        """
+        return CircleView(
+            channels=self.channels[circle_id],
+            members=self.channel_members[circle_id],
+            requests=self.channel_requests.setdefault(circle_id, {}),
+        )
+
     @staticmethod
     def default(bind: str, port: int) -> State:
         from felundchat.crypto import sha256_hex  # local import avoids circular dep
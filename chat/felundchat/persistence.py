@@ -1,7 +1,10 @@
 from __future__ import annotations
 
 import dataclasses
+import itertools
 import json
+import threading
+from typing import Tuple
 
 import felundchat.config as _cfg
 from felundchat.config import MESSAGE_MAX_AGE_S, MAX_MESSAGES_PER_CIRCLE
@@ -29,6 +32,14 @@ def _load_dataclass_strict(cls, payload: dict, label: str):
         ) from e
 
 
+# Serializes the tmp-file write + rename so concurrent savers never race on
+# the same STATE_FILE.tmp. Snapshots are numbered as they are taken so an
+# older one that reaches the write late cannot overwrite a newer file.
+_write_lock = threading.Lock()
+_snapshot_seq = itertools.count(1)
+_last_written_seq = 0
+
+
 def ensure_app_dir() -> None:
     _cfg.APP_DIR.mkdir(parents=True, exist_ok=True)
 
@@ -162,7 +173,16 @@ def _serialize_message(m: ChatMessage) -> dict:
 
 
 def save_state(state: State) -> None:
-    ensure_app_dir()
+    write_state_text(*serialize_state(state))
+
+
+def serialize_state(state: State) -> Tuple[int, str]:
+    """Prune expired messages and return (snapshot seq, JSON text) for the state file.
+
+    Reads and mutates the live State, so call it on the thread that owns the
+    state (the event loop in the TUI); only write_state_text() may be handed
+    off to a worker thread.
+    """
     prune_messages(state)
     data = {
         "node": dataclasses.asdict(state.node),
@@ -191,6 +211,16 @@ def save_state(state: State) -> None:
             for cid, node_map in state.anchor_records.items()
         },
     }
+    return next(_snapshot_seq), json.dumps(data, indent=2, sort_keys=True)
+
+
+def write_state_text(seq: int, text: str) -> None:
+    global _last_written_seq
+    ensure_app_dir()
     tmp = _cfg.STATE_FILE.with_suffix(".tmp")
-    tmp.write_text(json.dumps(data, indent=2, sort_keys=True), encoding="utf-8")
-    tmp.replace(_cfg.STATE_FILE)
+    with _write_lock:
+        if seq < _last_written_seq:
+            return  # a newer snapshot is already on disk
+        tmp.write_text(text, encoding="utf-8")
+        tmp.replace(_cfg.STATE_FILE)
+        _last_written_seq = seq
@@ -88,12 +88,12 @@ def _render_text(text: str) -> str:
 _MENTION_RE = re.compile(r"(?<!\w)@([\w\-]+)", re.IGNORECASE)
 
 
-def _render_text_with_mentions(text: str, my_names: set[str]) -> tuple[str, bool]:
+def _render_text_with_mentions(text: str, my_names: frozenset[str]) -> tuple[str, bool]:
     """Render *text* as Rich markup and detect whether it mentions the local user.
 
     Returns ``(rendered_str, mentioned)`` where *mentioned* is True when any
     ``@token`` in the message case-insensitively matches one of *my_names*
-    (display name or node-id prefix).
+    (display name or node-id prefix, already lower-cased).
 
     @mentions are highlighted in bold yellow; ones that match *my_names* are
     additionally highlighted in reverse-video so they stand out even more.
@@ -105,7 +105,7 @@ def _render_text_with_mentions(text: str, my_names: set[str]) -> tuple[str, bool
     def _replace_mention(m: re.Match) -> str:
         nonlocal mentioned
         token = m.group(1)
-        if any(token.lower() == n.lower() for n in my_names):
+        if token.lower() in my_names:
             mentioned = True
             return f"[bold reverse yellow]@{markup_escape(token)}[/bold reverse yellow]"
         return f"[bold yellow]@{markup_escape(token)}[/bold yellow]"
@@ -114,9 +114,9 @@ def _render_text_with_mentions(text: str, my_names: set[str]) -> tuple[str, bool
     return rendered, mentioned
 
 
-def mentions_me(text: str, my_names: set[str]) -> bool:
-    """Return True if *text* contains an @mention matching any of *my_names*."""
-    return any(
-        token.lower() in {n.lower() for n in my_names}
-        for token in _MENTION_RE.findall(text)
-    )
+def mentions_me(text: str, my_names: frozenset[str]) -> bool:
+    """Return True if *text* contains an @mention matching any of *my_names*.
+
+    *my_names* must already be lower-cased (see ``ChatScreen._my_names``).
+    """
+    return any(token.lower() in my_names for token in _MENTION_RE.findall(text))
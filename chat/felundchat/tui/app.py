@@ -1,6 +1,8 @@
 """Top-level Textual application."""
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
+
 from textual.app import App
 from textual.binding import Binding
 
@@ -17,8 +19,16 @@ class FelundApp(App):
     BINDINGS = [Binding("ctrl+q", "quit", "Quit")]
 
     def on_mount(self) -> None:
+        # One long-lived worker for clipboard tool fallbacks (see InviteModal),
+        # so repeated invite dialogs don't pay for a fresh thread each time.
+        self._clipboard_executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="clipboard"
+        )
         state = load_state()
         if state.circles:
             self.push_screen(ChatScreen(state))
         else:
             self.push_screen(SetupScreen())
+
+    def on_unmount(self) -> None:
+        self._clipboard_executor.shutdown(wait=False)
@@ -25,7 +25,7 @@ from felundchat.chat import ensure_default_channel
 from felundchat.crypto import make_message_mac, sha256_hex
 from felundchat.gossip import GossipNode
 from felundchat.models import ChatMessage, State, now_ts
-from felundchat.persistence import save_state
+from felundchat.persistence import save_state, serialize_state, write_state_text
 from felundchat.rendezvous_client import (
     is_network_error,
     lookup_peer_addrs,
@@ -47,6 +47,10 @@ from rich.markup import escape as markup_escape
 from textual.suggester import Suggester
 
 
+# Delay used to coalesce bursts of state mutations into a single save_state().
+_SAVE_DEBOUNCE_S = 0.25
+
+
 # ---------------------------------------------------------------------------
 # @mention auto-completer
 # ---------------------------------------------------------------------------
@@ -138,8 +142,17 @@ class ChatScreen(CommandsMixin, Screen):
         self._current_circle_id: Optional[str] = None
         self._current_channel: str = "general"
         self._seen: Set[str] = set()
+        # Lower-cased names that count as "me"; rebuilt when the display name changes.
+        self._my_names_cache: Optional[frozenset] = None
+        # Circles whose default channel maps are known to exist.
+        self._circle_initialized: Set[str] = set()
         self._gossip_task: Optional[asyncio.Task] = None
         self._rendezvous_task: Optional[asyncio.Task] = None
+        self._save_pending: Optional[asyncio.Task] = None
+        # Set by _schedule_save(); cleared when a save snapshots the state.
+        self._save_dirty = False
+        # Cached in on_mount so log writes skip a DOM query each time.
+        self._message_log: Optional[RichLog] = None
         # Per-circle relay cursor: last server_time returned by GET /v1/messages
         self._relay_cursors: dict = {}
 
@@ -161,8 +174,9 @@ class ChatScreen(CommandsMixin, Screen):
         yield Footer()
 
     async def on_mount(self) -> None:
+        self._message_log = self.query_one("#message-log", RichLog)
         for cid in self.state.circles:
-            ensure_default_channel(self.state, cid)
+            self._ensure_circle_ready(cid)
 
         circles = sorted(self.state.circles.keys())
         if circles:
@@ -212,6 +226,11 @@ class ChatScreen(CommandsMixin, Screen):
                 with contextlib.suppress(asyncio.CancelledError):
                     await task
 
+        # Flush any debounced save so the last commands are not lost on exit.
+        if self._save_pending and not self._save_pending.done():
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._save_pending
+
         api_base = safe_api_base_from_env()
         if api_base and self.node:
             for cid in list(self.state.circles.keys()):
@@ -223,6 +242,12 @@ class ChatScreen(CommandsMixin, Screen):
 
     # ── Sidebar ───────────────────────────────────────────────────────────────
 
+    def _ensure_circle_ready(self, cid: str) -> None:
+        """Run ensure_default_channel() once per circle for this screen."""
+        if cid not in self._circle_initialized:
+            ensure_default_channel(self.state, cid)
+            self._circle_initialized.add(cid)
+
     def _circle_label(self, cid: str) -> str:
         circle = self.state.circles.get(cid)
         return circle.name if circle and circle.name else cid[:8]
@@ -235,7 +260,7 @@ class ChatScreen(CommandsMixin, Screen):
                 f"* {self._circle_label(cid)}",
                 data={"type": "circle", "cid": cid},
             )
-            ensure_default_channel(self.state, cid)
+            self._ensure_circle_ready(cid)
             for ch_id in sorted(self.state.channels.get(cid, {}).keys()):
                 active = cid == self._current_circle_id and ch_id == self._current_channel
                 label = f"#{ch_id} <" if active else f"#{ch_id}"
@@ -266,7 +291,7 @@ class ChatScreen(CommandsMixin, Screen):
     def _load_history(self) -> None:
         if not self._current_circle_id:
             return
-        log = self.query_one("#message-log", RichLog)
+        log = self._message_log
         for m in self._visible_msgs()[-50:]:
             self._seen.add(m.msg_id)
             log.write(self._fmt(m))
@@ -275,7 +300,7 @@ class ChatScreen(CommandsMixin, Screen):
         if not self._current_circle_id:
             return
         self._process_control_events()
-        log = self.query_one("#message-log", RichLog)
+        log = self._message_log
         new_msgs = [m for m in self._visible_msgs() if m.msg_id not in self._seen]
         for m in new_msgs:
             self._seen.add(m.msg_id)
@@ -302,11 +327,14 @@ class ChatScreen(CommandsMixin, Screen):
                     save_state(self.state)
                     self._refresh_sidebar()
 
-    def _my_names(self) -> set:
+    def _my_names(self) -> frozenset:
         """Names/prefixes that count as 'me' for @mention matching."""
-        names = {self.state.node.display_name.lower()}
-        names.add(self.state.node.node_id[:8].lower())
-        return names
+        if self._my_names_cache is None:
+            self._my_names_cache = frozenset((
+                self.state.node.display_name.lower(),
+                self.state.node.node_id[:8].lower(),
+            ))
+        return self._my_names_cache
 
     def _fmt(self, m: ChatMessage) -> str:
         ts = time.strftime("%H:%M", time.localtime(m.created_ts))
@@ -325,11 +353,41 @@ class ChatScreen(CommandsMixin, Screen):
         return f"[dim]{ts}[/dim] [bold {color}]{author}[/bold {color}]: {body}"
 
     def _log_system(self, msg: str) -> None:
-        self.query_one("#message-log", RichLog).write(f"[dim italic]  {msg}[/dim italic]")
+        self._message_log.write(f"[dim italic]  {msg}[/dim italic]")
 
     def _log_raw(self, msg: str) -> None:
         """Write a line to the message log with full Rich markup."""
-        self.query_one("#message-log", RichLog).write(msg)
+        self._message_log.write(msg)
+
+    def _log_raw_many(self, lines: List[str]) -> None:
+        """Write several markup lines to the message log in a single update."""
+        if lines:
+            self._message_log.write("\n".join(lines))
+
+    # ── Persistence ───────────────────────────────────────────────────────────
+
+    def _schedule_save(self) -> None:
+        """Save state shortly, coalescing bursts of mutations into one write."""
+        self._save_dirty = True
+        if self._save_pending and not self._save_pending.done():
+            return
+        self._save_pending = asyncio.create_task(self._deferred_save())
+
+    async def _deferred_save(self) -> None:
+        await asyncio.sleep(_SAVE_DEBOUNCE_S)
+        # Loop until a write completes with no mutations made during it; the
+        # task stays in _save_pending throughout so on_unmount can wait on it.
+        while self._save_dirty:
+            self._save_dirty = False
+            try:
+                # Hold the lock across the write so other savers cannot slip a
+                # newer snapshot in between.
+                async with self.node._lock:
+                    seq, text = serialize_state(self.state)
+                    await asyncio.to_thread(write_state_text, seq, text)
+            except Exception as e:
+                self._log_system(f"Failed to save state: {e}")
+                return
 
     # ── Rendezvous ────────────────────────────────────────────────────────────
 
@@ -411,7 +469,7 @@ class ChatScreen(CommandsMixin, Screen):
             self.state.messages[msg_id] = msg
             save_state(self.state)
         self._seen.add(msg_id)
-        self.query_one("#message-log", RichLog).write(self._fmt(msg))
+        self._message_log.write(self._fmt(msg))
         asyncio.create_task(self._sync_once())
 
     async def _sync_once(self) -> None:
@@ -435,8 +493,8 @@ class ChatScreen(CommandsMixin, Screen):
             return
         self._current_circle_id = cid
         self._current_channel = ch_id
-        self._seen = set()
-        self.query_one("#message-log", RichLog).clear()
+        self._seen.clear()
+        self._message_log.clear()
         self._load_history()
         self._refresh_sidebar()
         self.query_one("#message-input", Input).focus()
@@ -471,6 +529,7 @@ class ChatScreen(CommandsMixin, Screen):
         self.state.node.display_name = new_name
         self.state.node.rendezvous_base = new_base
         self.state.node_display_names[self.state.node.node_id] = new_name
+        self._my_names_cache = None
 
         async with self.node._lock:
             save_state(self.state)
@@ -7,19 +7,22 @@ itself is intentionally free of __init__ and screen-lifecycle code.
 from __future__ import annotations
 
 import asyncio
+import heapq
+import types
+from operator import attrgetter
 
-from textual.widgets import RichLog
+from rich.markup import escape as markup_escape
 
 from felundchat.channel_sync import (
     apply_channel_event,
     make_channel_event_message,
     make_circle_name_message,
 )
-from felundchat.chat import create_circle, ensure_default_channel
+from felundchat.chat import create_circle
 from felundchat.crypto import sha256_hex
-from felundchat.invite import is_relay_url, make_felund_code, parse_felund_code
-from felundchat.models import Channel, Circle, now_ts
-from felundchat.persistence import save_state
+from felundchat.invite import is_relay_url, make_felund_code, parse_felund_code_cached
+from felundchat.models import Channel, Circle, CircleView, now_ts
+from felundchat.persistence import serialize_state, write_state_text
 from felundchat.transport import public_addr_hint
 
 from ._utils import mentions_me, _render_text_with_mentions
@@ -30,95 +33,130 @@ from .modals import HelpModal, InviteModal, SettingsModal
 # Help content
 # ---------------------------------------------------------------------------
 
-def _help_lines(topic: str = "") -> list:
+_FULL_HELP = (
+    "[bold]felundchat — slash commands[/bold]",
+    "",
+    "[bold cyan]General[/bold cyan]",
+    "  [bold]/help[/bold] [dim][topic][/dim]           This screen; /help channel for channel docs",
+    "  [bold]/settings[/bold]               Open settings modal (display name, relay URL)",
+    "  [bold]/quit[/bold]                   Exit felundchat",
+    "  [bold]/debug[/bold]                  Toggle gossip-sync debug log",
+    "",
+    "[bold cyan]Identity[/bold cyan]",
+    "  [bold]/name[/bold]                   Show your current display name",
+    "  [bold]/name[/bold] [dim]<new name>[/dim]        Change your display name (gossiped to peers)",
+    "",
+    "[bold cyan]Circles[/bold cyan]",
+    "  [bold]/circles[/bold]                List all circles you are in",
+    "  [bold]/circle create[/bold] [dim][name][/dim]   Create a new circle (shows invite code)",
+    "  [bold]/circle name[/bold] [dim]<label>[/dim]    Rename the active circle",
+    "  [bold]/circle leave[/bold]            Leave the active circle",
+    "  [bold]/invite[/bold]                  Show/copy invite code for the active circle",
+    "  [bold]/join[/bold] [dim]<code>[/dim]            Join a circle using an invite code",
+    "",
+    "[bold cyan]Channels[/bold cyan]",
+    "  [bold]/channels[/bold]               List channels in the active circle",
+    "  [bold]/channel create[/bold] [dim]<name>[/dim] [dim][public|key|invite][/dim]",
+    "                          Create a channel (default access: public)",
+    "  [bold]/channel switch[/bold] [dim]<name>[/dim]  Switch to another channel",
+    "  [bold]/channel join[/bold] [dim]<name>[/dim]    Join a channel",
+    "  [bold]/channel leave[/bold] [dim]<name>[/dim]   Leave a channel",
+    "  [bold]/channel requests[/bold] [dim]<name>[/dim]",
+    "                          View pending join requests (owner only)",
+    "  [bold]/channel approve[/bold] [dim]<name> <node_id>[/dim]",
+    "                          Approve a join request (owner only)",
+    "",
+    "[bold cyan]People & Messages[/bold cyan]",
+    "  [bold]/who[/bold] [dim][channel][/dim]           Show members of a channel",
+    "  [bold]/inbox[/bold] [dim][--mentions|-m] [N][/dim]",
+    "                          Recent messages (across all circles/channels).",
+    "                          --mentions / -m  →  only show @mentions of you.",
+    "                          N                →  how many to show (default 20).",
+    "",
+    "[bold cyan]Keyboard shortcuts[/bold cyan]",
+    "  [bold]F1[/bold]         Open this help screen",
+    "  [bold]F2[/bold]         Show invite code modal",
+    "  [bold]F3[/bold]         Open settings (display name, relay URL)",
+    "  [bold]Ctrl+Q[/bold]     Quit",
+    "  [bold]Escape[/bold]     Focus the message input",
+    "  [bold]Tab[/bold]        Accept @mention autocomplete suggestion",
+    "",
+    "[dim]Tip: @mention a peer by typing @ and at least 2 characters — Tab to complete.[/dim]",
+)
+
+_CHANNEL_HELP = (
+    "[bold]Channel commands[/bold]",
+    "",
+    "  [bold]/channel create[/bold] [dim]<name> [public|key|invite][/dim]",
+    "      Create a channel.  Access modes:",
+    "        [bold]public[/bold]  — anyone in the circle can join automatically",
+    "        [bold]key[/bold]     — requires a shared passphrase (not yet enforced)",
+    "        [bold]invite[/bold]  — owner must approve each join request",
+    "",
+    "  [bold]/channel switch[/bold] [dim]<name>[/dim]",
+    "      Switch the active channel (also clickable in the sidebar).",
+    "",
+    "  [bold]/channel join[/bold] [dim]<name>[/dim]",
+    "      Join a channel and start receiving its messages.",
+    "",
+    "  [bold]/channel leave[/bold] [dim]<name>[/dim]",
+    "      Leave a channel (you cannot leave #general).",
+    "",
+    "  [bold]/channel requests[/bold] [dim]<name>[/dim]",
+    "      List users waiting to join an invite-only channel.",
+    "      Only available to the channel owner.",
+    "",
+    "  [bold]/channel approve[/bold] [dim]<name> <node_id_prefix>[/dim]",
+    "      Approve a pending join request.  You only need the first few",
+    "      characters of the node ID shown by /channel requests.",
+)
+
+# Read-only topic -> lines table, built once at import.
+_HELP_TOPICS = types.MappingProxyType({
+    "channel": _CHANNEL_HELP,
+    "channels": _CHANNEL_HELP,
+})
+
+
+def _help_lines(topic: str = "") -> tuple:
     """Return Rich-markup lines for the help modal.
 
     Pass an empty string (or no argument) for the full command reference.
     Pass a command name (e.g. ``"channel"``) for focused help on that group.
     """
-    FULL = [
-        "[bold]felundchat — slash commands[/bold]",
-        "",
-        "[bold cyan]General[/bold cyan]",
-        "  [bold]/help[/bold] [dim][topic][/dim]           This screen; /help channel for channel docs",
-        "  [bold]/settings[/bold]               Open settings modal (display name, relay URL)",
-        "  [bold]/quit[/bold]                   Exit felundchat",
-        "  [bold]/debug[/bold]                  Toggle gossip-sync debug log",
-        "",
-        "[bold cyan]Identity[/bold cyan]",
-        "  [bold]/name[/bold]                   Show your current display name",
-        "  [bold]/name[/bold] [dim]<new name>[/dim]        Change your display name (gossiped to peers)",
-        "",
-        "[bold cyan]Circles[/bold cyan]",
-        "  [bold]/circles[/bold]                List all circles you are in",
-        "  [bold]/circle create[/bold] [dim][name][/dim]   Create a new circle (shows invite code)",
-        "  [bold]/circle name[/bold] [dim]<label>[/dim]    Rename the active circle",
-        "  [bold]/circle leave[/bold]            Leave the active circle",
-        "  [bold]/invite[/bold]                  Show/copy invite code for the active circle",
-        "  [bold]/join[/bold] [dim]<code>[/dim]            Join a circle using an invite code",
-        "",
-        "[bold cyan]Channels[/bold cyan]",
-        "  [bold]/channels[/bold]               List channels in the active circle",
-        "  [bold]/channel create[/bold] [dim]<name>[/dim] [dim][public|key|invite][/dim]",
-        "                          Create a channel (default access: public)",
-        "  [bold]/channel switch[/bold] [dim]<name>[/dim]  Switch to another channel",
-        "  [bold]/channel join[/bold] [dim]<name>[/dim]    Join a channel",
-        "  [bold]/channel leave[/bold] [dim]<name>[/dim]   Leave a channel",
-        "  [bold]/channel requests[/bold] [dim]<name>[/dim]",
-        "                          View pending join requests (owner only)",
-        "  [bold]/channel approve[/bold] [dim]<name> <node_id>[/dim]",
-        "                          Approve a join request (owner only)",
-        "",
-        "[bold cyan]People & Messages[/bold cyan]",
-        "  [bold]/who[/bold] [dim][channel][/dim]           Show members of a channel",
-        "  [bold]/inbox[/bold] [dim][--mentions|-m] [N][/dim]",
-        "                          Recent messages (across all circles/channels).",
-        "                          --mentions / -m  →  only show @mentions of you.",
-        "                          N                →  how many to show (default 20).",
-        "",
-        "[bold cyan]Keyboard shortcuts[/bold cyan]",
-        "  [bold]F1[/bold]         Open this help screen",
-        "  [bold]F2[/bold]         Show invite code modal",
-        "  [bold]F3[/bold]         Open settings (display name, relay URL)",
-        "  [bold]Ctrl+Q[/bold]     Quit",
-        "  [bold]Escape[/bold]     Focus the message input",
-        "  [bold]Tab[/bold]        Accept @mention autocomplete suggestion",
-        "",
-        "[dim]Tip: @mention a peer by typing @ and at least 2 characters — Tab to complete.[/dim]",
-    ]
-
-    CHANNEL_HELP = [
-        "[bold]Channel commands[/bold]",
-        "",
-        "  [bold]/channel create[/bold] [dim]<name> [public|key|invite][/dim]",
-        "      Create a channel.  Access modes:",
-        "        [bold]public[/bold]  — anyone in the circle can join automatically",
-        "        [bold]key[/bold]     — requires a shared passphrase (not yet enforced)",
-        "        [bold]invite[/bold]  — owner must approve each join request",
-        "",
-        "  [bold]/channel switch[/bold] [dim]<name>[/dim]",
-        "      Switch the active channel (also clickable in the sidebar).",
-        "",
-        "  [bold]/channel join[/bold] [dim]<name>[/dim]",
-        "      Join a channel and start receiving its messages.",
-        "",
-        "  [bold]/channel leave[/bold] [dim]<name>[/dim]",
-        "      Leave a channel (you cannot leave #general).",
-        "",
-        "  [bold]/channel requests[/bold] [dim]<name>[/dim]",
-        "      List users waiting to join an invite-only channel.",
-        "      Only available to the channel owner.",
-        "",
-        "  [bold]/channel approve[/bold] [dim]<name> <node_id_prefix>[/dim]",
-        "      Approve a pending join request.  You only need the first few",
-        "      characters of the node ID shown by /channel requests.",
-    ]
-
     topic = (topic or "").strip().lstrip("/").lower()
-
-    if topic in ("channel", "channels"):
-        return CHANNEL_HELP
-    return FULL
+    return _HELP_TOPICS.get(topic, _FULL_HELP)
+
+
+# Chronological message ordering (ties broken by msg_id), as used by ChatScreen.
+_MSG_ORDER = attrgetter("created_ts", "msg_id")
+
+# Canonical (lower-case) command names; typed commands usually match exactly,
+# so .lower() is only needed for the rare mixed-case spelling.
+_KNOWN_COMMANDS = frozenset({
+    "/help", "/quit", "/circles", "/channels", "/invite", "/join", "/who",
+    "/inbox", "/name", "/settings", "/debug", "/circle", "/channel",
+})
+
+
+# Sub-command grammar: group -> sub-command -> handler method name.  Built
+# once at import; dispatch is a single dict walk per token, and the keys
+# double as the completion candidates for each group.
+_SUBCOMMANDS = types.MappingProxyType({
+    "/circle": types.MappingProxyType({
+        "create": "_circle_create",
+        "name": "_circle_name",
+        "leave": "_circle_leave",
+    }),
+    "/channel": types.MappingProxyType({
+        "create": "_channel_create",
+        "switch": "_channel_switch",
+        "join": "_channel_join",
+        "leave": "_channel_leave",
+        "requests": "_channel_requests",
+        "approve": "_channel_approve",
+    }),
+})
 
 
 class CommandsMixin:
@@ -141,8 +179,9 @@ class CommandsMixin:
     # ── Top-level command dispatcher ──────────────────────────────────────────
 
     async def _handle_command(self, text: str) -> None:
-        parts = text.split()
-        cmd = parts[0].lower()
+        # Bare commands (/help, /quit, …) skip the split() allocation.
+        parts = text.split() if " " in text else [text]
+        cmd = parts[0] if parts[0] in _KNOWN_COMMANDS else parts[0].lower()
 
         if cmd == "/help":
             await self._cmd_help(parts)
@@ -160,7 +199,7 @@ class CommandsMixin:
             if not self._current_circle_id:
                 self._log_system("No active circle.")
                 return
-            ensure_default_channel(self.state, self._current_circle_id)
+            self._ensure_circle_ready(self._current_circle_id)
             for ch in sorted(self.state.channels.get(self._current_circle_id, {}).keys()):
                 active = " <" if ch == self._current_channel else ""
                 self._log_system(f"  #{ch}{active}")
@@ -217,21 +256,24 @@ class CommandsMixin:
             self._log_system("Usage: /join <invite_code>")
             return
         try:
-            secret_hex, peer_addr = parse_felund_code(parts[1])
+            secret_hex, peer_addr = parse_felund_code_cached(parts[1])
         except Exception as e:
             self._log_system(f"Invalid code: {e}")
             return
         secret = bytes.fromhex(secret_hex)
         circle_id = sha256_hex(secret)[:24]
-        self.state.circles[circle_id] = Circle(circle_id=circle_id, secret_hex=secret_hex)
-        self.state.circle_members.setdefault(circle_id, set()).add(self.state.node.node_id)
-        ensure_default_channel(self.state, circle_id)
-        async with self.node._lock:
-            save_state(self.state)
+        if circle_id not in self.state.circles:
+            self.state.circles[circle_id] = Circle(circle_id=circle_id, secret_hex=secret_hex)
+            members = self.state.circle_members.get(circle_id)
+            if members is None:
+                members = self.state.circle_members[circle_id] = set()
+            members.add(self.state.node.node_id)
+            self._ensure_circle_ready(circle_id)
+            self._schedule_save()
         self._current_circle_id = circle_id
         self._current_channel = "general"
-        self._seen = set()
-        self.query_one("#message-log", RichLog).clear()
+        self._seen.clear()
+        self._message_log.clear()
         self._refresh_sidebar()
         if peer_addr and not is_relay_url(peer_addr):
             asyncio.create_task(self.node.connect_and_sync(peer_addr, circle_id))
@@ -269,14 +311,16 @@ class CommandsMixin:
 
         my_names = self._my_names()
 
-        all_msgs = sorted(
-            (
-                m for m in self.state.messages.values()
-                if m.channel_id != "__control"
-                and (not mentions_only or mentions_me(m.text, my_names))
-            ),
-            key=lambda m: (m.created_ts, m.msg_id),
-        )[-limit:]
+        cands = [m for m in self.state.messages.values() if m.channel_id != "__control"]
+        if mentions_only:
+            cands = [m for m in cands if mentions_me(m.text, my_names)]
+        if limit <= 0:
+            # "/inbox 0" has always meant everything (the old [-0:] slice).
+            all_msgs = sorted(cands, key=_MSG_ORDER)
+        else:
+            # Top-N selection instead of sorting the whole store; oldest first for display.
+            all_msgs = heapq.nlargest(limit, cands, key=_MSG_ORDER)
+            all_msgs.reverse()
 
         if not all_msgs:
             label = "@mentions" if mentions_only else "messages"
@@ -284,19 +328,22 @@ class CommandsMixin:
             return
 
         label = f"Last {len(all_msgs)} @mentions" if mentions_only else f"Last {len(all_msgs)} messages"
-        self._log_raw(f"[bold]─── {label} ─────────────────────────────────[/bold]")
+        out = [f"[bold]─── {label} ─────────────────────────────────[/bold]"]
         for m in all_msgs:
             ts = _time.strftime("%m/%d %H:%M", _time.localtime(m.created_ts))
             live_name = self.state.node_display_names.get(m.author_node_id, "")
-            author = live_name or m.display_name or m.author_node_id[:8]
+            # Names and channel ids come from peers and share one markup string
+            # with every other row, so escape them to keep a stray tag contained.
+            author = markup_escape(live_name or m.display_name or m.author_node_id[:8])
             circle = self.state.circles.get(m.circle_id)
-            circle_label = (circle.name if circle and circle.name else m.circle_id[:8])
+            circle_label = markup_escape(circle.name if circle and circle.name else m.circle_id[:8])
             body, _ = _render_text_with_mentions(m.text, my_names)
-            self._log_raw(
+            out.append(
                 f"[dim]{ts}[/dim] [dim cyan]{circle_label}[/dim cyan]"
-                f"[dim]/#[/dim][dim cyan]{m.channel_id}[/dim cyan]"
+                f"[dim]/#[/dim][dim cyan]{markup_escape(m.channel_id)}[/dim cyan]"
                 f"  [bold]{author}[/bold]: {body}"
             )
+        self._log_raw_many(out)
 
     async def _cmd_name(self, parts: list) -> None:
         if len(parts) == 1:
@@ -308,99 +355,112 @@ class CommandsMixin:
             return
         self.state.node.display_name = new_name
         self.state.node_display_names[self.state.node.node_id] = new_name
-        async with self.node._lock:
-            save_state(self.state)
-        for cid in list(self.state.circles.keys()):
-            event = {
-                "t": "CHANNEL_EVT", "op": "rename",
-                "node_id": self.state.node.node_id,
-                "display_name": new_name,
-            }
-            msg = make_channel_event_message(self.state, cid, event)
+        self._my_names_cache = None
+        self._schedule_save()
+        event = {
+            "t": "CHANNEL_EVT", "op": "rename",
+            "node_id": self.state.node.node_id,
+            "display_name": new_name,
+        }
+        # Each event is MAC'd and AES-GCM encrypted; build them off the event loop.
+        msgs = await asyncio.gather(*(
+            asyncio.to_thread(make_channel_event_message, self.state, cid, event)
+            for cid in self.state.circles
+        ))
+        for msg in msgs:
             if msg:
                 self.state.messages[msg.msg_id] = msg
                 self._seen.add(msg.msg_id)
         self._log_system(f"Display name updated to '{new_name}'. Syncing to peers...")
         asyncio.create_task(self._sync_once())
 
+    # ── Sub-command dispatch ──────────────────────────────────────────────────
+
+    def _subcommand_handler(self, group: str, args: list):
+        """Walk *args* through ``_SUBCOMMANDS``; return the bound handler or None."""
+        name = _SUBCOMMANDS[group].get(args[0].lower()) if args else None
+        return getattr(self, name) if name else None
+
     # ── /circle sub-commands ──────────────────────────────────────────────────
 
     async def _circle_mgmt_cmd(self, args: list) -> None:
-        if not args:
+        handler = self._subcommand_handler("/circle", args)
+        if handler is None:
             self._log_system("Usage: /circle create [name]  |  /circle name <label>  |  /circle leave")
             return
-        sub = args[0].lower()
-
-        if sub == "create":
-            name = " ".join(args[1:]).strip() if len(args) > 1 else ""
-            circle = create_circle(self.state)
-            if name:
-                circle.name = name
-            async with self.node._lock:
-                save_state(self.state)
-            if name:
-                self._gossip_circle_name(circle.circle_id, name)
-            self._current_circle_id = circle.circle_id
-            self._current_channel = "general"
-            self._seen = set()
-            self.query_one("#message-log", RichLog).clear()
+        await handler(args)
+
+    async def _circle_create(self, args: list) -> None:
+        name = " ".join(args[1:]).strip() if len(args) > 1 else ""
+        circle = create_circle(self.state)
+        if name:
+            circle.name = name
+        self._schedule_save()
+        if name:
+            self._gossip_circle_name(circle.circle_id, name)
+        self._current_circle_id = circle.circle_id
+        self._current_channel = "general"
+        self._seen.clear()
+        self._message_log.clear()
+        self._refresh_sidebar()
+        addr = public_addr_hint(self.state.node.bind, self.state.node.port)
+        code = make_felund_code(circle.secret_hex, addr)
+        label = f'"{name}"' if name else circle.circle_id[:8]
+        self._log_system(f"Circle {label} created.")
+        await self.app.push_screen(InviteModal(code))
+
+    async def _circle_name(self, args: list) -> None:
+        if len(args) < 2:
+            self._log_system("Usage: /circle name <friendly label>")
+            return
+        if not self._current_circle_id:
+            self._log_system("No active circle.")
+            return
+        new_name = " ".join(args[1:]).strip()
+        circle = self.state.circles.get(self._current_circle_id)
+        if circle:
+            circle.name = new_name
+            self._schedule_save()
+            self._gossip_circle_name(self._current_circle_id, new_name)
             self._refresh_sidebar()
-            addr = public_addr_hint(self.state.node.bind, self.state.node.port)
-            code = make_felund_code(circle.secret_hex, addr)
-            label = f'"{name}"' if name else circle.circle_id[:8]
-            self._log_system(f"Circle {label} created.")
-            await self.app.push_screen(InviteModal(code))
-
-        elif sub == "name":
-            if len(args) < 2:
-                self._log_system("Usage: /circle name <friendly label>")
-                return
-            if not self._current_circle_id:
-                self._log_system("No active circle.")
-                return
-            new_name = " ".join(args[1:]).strip()
-            circle = self.state.circles.get(self._current_circle_id)
-            if circle:
-                circle.name = new_name
-                save_state(self.state)
-                self._gossip_circle_name(self._current_circle_id, new_name)
-                self._refresh_sidebar()
-                self._log_system(f"Circle renamed to '{new_name}'. Name will gossip to peers.")
-
-        elif sub == "leave":
-            cid = self._current_circle_id
-            if not cid:
-                self._log_system("No active circle.")
-                return
-            label = self._circle_label(cid)
-            self.state.circles.pop(cid, None)
-            self.state.circle_members.pop(cid, None)
-            self.state.channels.pop(cid, None)
-            self.state.channel_members.pop(cid, None)
-            self.state.channel_requests.pop(cid, None)
-            to_drop = [mid for mid, m in self.state.messages.items() if m.circle_id == cid]
-            for mid in to_drop:
-                del self.state.messages[mid]
-            save_state(self.state)
-            self._log_system(f"Left circle '{label}'.")
-            remaining = sorted(self.state.circles.keys())
-            if remaining:
-                self._current_circle_id = remaining[0]
-                self._current_channel = "general"
-                self._seen = set()
-                self.query_one("#message-log", RichLog).clear()
-                self._refresh_sidebar()
-                self._load_history()
-            else:
-                self._current_circle_id = None
-                self.query_one("#message-log", RichLog).clear()
-                self._refresh_sidebar()
-                # Local import breaks the circular dep with setup_screen.
-                from .setup_screen import SetupScreen
-                await self.app.push_screen(SetupScreen())
+            self._log_system(f"Circle renamed to '{new_name}'. Name will gossip to peers.")
 
+    async def _circle_leave(self, args: list) -> None:
+        cid = self._current_circle_id
+        if not cid:
+            self._log_system("No active circle.")
+            return
+        label = self._circle_label(cid)
+        self.state.circles.pop(cid, None)
+        self.state.circle_members.pop(cid, None)
+        self.state.channels.pop(cid, None)
+        self.state.channel_members.pop(cid, None)
+        self.state.channel_requests.pop(cid, None)
+        self._circle_initialized.discard(cid)
+        to_drop = [mid for mid, m in self.state.messages.items() if m.circle_id == cid]
+        for mid in to_drop:
+            del self.state.messages[mid]
+        # Saved immediately: SetupScreen reloads state from disk if this
+        # was the last circle.
+        async with self.node._lock:
+            seq, text = serialize_state(self.state)
+            await asyncio.to_thread(write_state_text, seq, text)
+        self._log_system(f"Left circle '{label}'.")
+        remaining = sorted(self.state.circles.keys())
+        if remaining:
+            self._current_circle_id = remaining[0]
+            self._current_channel = "general"
+            self._seen.clear()
+            self._message_log.clear()
+            self._refresh_sidebar()
+            self._load_history()
         else:
-            self._log_system("Usage: /circle create [name]  |  /circle name <label>  |  /circle leave")
+            self._current_circle_id = None
+            self._message_log.clear()
+            self._refresh_sidebar()
+            # Local import breaks the circular dep with setup_screen.
+            from .setup_screen import SetupScreen
+            await self.app.push_screen(SetupScreen())
 
     # ── /channel sub-commands ─────────────────────────────────────────────────
 
@@ -408,149 +468,142 @@ class CommandsMixin:
         if not args or not self._current_circle_id:
             self._log_system("Usage: /channel create|join|switch|leave|requests|approve <name>")
             return
+        handler = self._subcommand_handler("/channel", args)
+        if handler is None:
+            self._log_system("Usage: /channel create|join|switch|leave|requests|approve <name>")
+            return
+        self._ensure_circle_ready(self._current_circle_id)
+        await handler(args, self.state.circle_view(self._current_circle_id))
 
-        ensure_default_channel(self.state, self._current_circle_id)
-        channels = self.state.channels[self._current_circle_id]
-        members_map = self.state.channel_members[self._current_circle_id]
-        requests_map = self.state.channel_requests.setdefault(self._current_circle_id, {})
-        sub = args[0].lower()
-
-        if sub == "create":
-            if len(args) < 2:
-                self._log_system("Usage: /channel create <name> [public|key|invite]")
-                return
-            ch_id = args[1].lower()
-            access_mode = args[2].lower() if len(args) > 2 else "public"
-            if access_mode not in {"public", "key", "invite"}:
-                self._log_system("Access mode must be: public, key, or invite")
-                return
-            if ch_id in channels:
-                self._log_system(f"#{ch_id} already exists.")
-                return
-            channels[ch_id] = Channel(
-                channel_id=ch_id,
-                circle_id=self._current_circle_id,
-                created_by=self.state.node.node_id,
-                created_ts=now_ts(),
-                access_mode=access_mode,
-            )
-            members_map.setdefault(ch_id, set()).add(self.state.node.node_id)
-            requests_map.setdefault(ch_id, set())
-            event = {
-                "t": "CHANNEL_EVT", "op": "create",
-                "circle_id": self._current_circle_id, "channel_id": ch_id,
-                "access_mode": access_mode, "key_hash": "",
-                "actor_node_id": self.state.node.node_id,
-                "created_by": self.state.node.node_id, "created_ts": now_ts(),
-            }
-            msg = make_channel_event_message(self.state, self._current_circle_id, event)
-            if msg:
-                self.state.messages[msg.msg_id] = msg
-                self._seen.add(msg.msg_id)
-            async with self.node._lock:
-                save_state(self.state)
-            self._refresh_sidebar()
-            self._log_system(f"Created #{ch_id} [{access_mode}].")
+    async def _channel_create(self, args: list, cv: CircleView) -> None:
+        if len(args) < 2:
+            self._log_system("Usage: /channel create <name> [public|key|invite]")
+            return
+        ch_id = args[1].lower()
+        access_mode = args[2].lower() if len(args) > 2 else "public"
+        if access_mode not in {"public", "key", "invite"}:
+            self._log_system("Access mode must be: public, key, or invite")
+            return
+        if ch_id in cv.channels:
+            self._log_system(f"#{ch_id} already exists.")
+            return
+        cv.channels[ch_id] = Channel(
+            channel_id=ch_id,
+            circle_id=self._current_circle_id,
+            created_by=self.state.node.node_id,
+            created_ts=now_ts(),
+            access_mode=access_mode,
+        )
+        cv.members.setdefault(ch_id, set()).add(self.state.node.node_id)
+        cv.requests.setdefault(ch_id, set())
+        event = {
+            "t": "CHANNEL_EVT", "op": "create",
+            "circle_id": self._current_circle_id, "channel_id": ch_id,
+            "access_mode": access_mode, "key_hash": "",
+            "actor_node_id": self.state.node.node_id,
+            "created_by": self.state.node.node_id, "created_ts": now_ts(),
+        }
+        msg = make_channel_event_message(self.state, self._current_circle_id, event)
+        if msg:
+            self.state.messages[msg.msg_id] = msg
+            self._seen.add(msg.msg_id)
+        self._schedule_save()
+        self._refresh_sidebar()
+        self._log_system(f"Created #{ch_id} [{access_mode}].")
 
-        elif sub == "switch":
-            if len(args) < 2:
-                self._log_system("Usage: /channel switch <name>")
-                return
-            ch_id = args[1].lower()
-            if ch_id not in channels:
-                self._log_system(f"Unknown channel #{ch_id}.")
-                return
-            self._current_channel = ch_id
-            self._seen = set()
-            self.query_one("#message-log", RichLog).clear()
-            self._load_history()
-            self._refresh_sidebar()
+    async def _channel_switch(self, args: list, cv: CircleView) -> None:
+        if len(args) < 2:
+            self._log_system("Usage: /channel switch <name>")
+            return
+        ch_id = args[1].lower()
+        if ch_id not in cv.channels:
+            self._log_system(f"Unknown channel #{ch_id}.")
+            return
+        self._current_channel = ch_id
+        self._seen.clear()
+        self._message_log.clear()
+        self._load_history()
+        self._refresh_sidebar()
 
-        elif sub == "join":
-            if len(args) < 2:
-                self._log_system("Usage: /channel join <name>")
-                return
-            ch_id = args[1].lower()
-            if ch_id not in channels:
-                self._log_system(f"Unknown channel #{ch_id}.")
-                return
-            members_map.setdefault(ch_id, set()).add(self.state.node.node_id)
-            async with self.node._lock:
-                save_state(self.state)
-            self._log_system(f"Joined #{ch_id}.")
-
-        elif sub == "leave":
-            if len(args) < 2:
-                self._log_system("Usage: /channel leave <name>")
-                return
-            ch_id = args[1].lower()
-            if ch_id == "general":
-                self._log_system("Cannot leave #general.")
-                return
-            members_map.get(ch_id, set()).discard(self.state.node.node_id)
-            async with self.node._lock:
-                save_state(self.state)
-            if self._current_channel == ch_id:
-                self._current_channel = "general"
-                self._seen = set()
-                self.query_one("#message-log", RichLog).clear()
-                self._load_history()
-            self._refresh_sidebar()
-            self._log_system(f"Left #{ch_id}.")
+    async def _channel_join(self, args: list, cv: CircleView) -> None:
+        if len(args) < 2:
+            self._log_system("Usage: /channel join <name>")
+            return
+        ch_id = args[1].lower()
+        if ch_id not in cv.channels:
+            self._log_system(f"Unknown channel #{ch_id}.")
+            return
+        cv.members.setdefault(ch_id, set()).add(self.state.node.node_id)
+        self._schedule_save()
+        self._log_system(f"Joined #{ch_id}.")
 
-        elif sub == "requests":
-            if len(args) < 2:
-                self._log_system("Usage: /channel requests <name>")
-                return
-            ch_id = args[1].lower()
-            if ch_id not in channels:
-                self._log_system(f"Unknown channel #{ch_id}.")
-                return
-            if channels[ch_id].created_by != self.state.node.node_id:
-                self._log_system("Only the channel owner can view pending requests.")
-                return
-            reqs = sorted(requests_map.get(ch_id, set()))
-            if not reqs:
-                self._log_system(f"#{ch_id} — no pending requests.")
-            else:
-                self._log_system(f"#{ch_id} — {len(reqs)} pending request(s):")
-                for nid in reqs:
-                    display = self.state.node_display_names.get(nid, nid[:8])
-                    self._log_system(f"  {display} [{nid[:8]}]")
-
-        elif sub == "approve":
-            if len(args) < 3:
-                self._log_system("Usage: /channel approve <name> <node_id>")
-                return
-            ch_id, prefix = args[1].lower(), args[2]
-            if ch_id not in channels:
-                self._log_system(f"Unknown channel #{ch_id}.")
-                return
-            if channels[ch_id].created_by != self.state.node.node_id:
-                self._log_system("Only the channel owner can approve requests.")
-                return
-            full_id = next(
-                (nid for nid in requests_map.get(ch_id, set()) if nid.startswith(prefix)),
-                None,
-            )
-            if not full_id:
-                self._log_system(f"No pending request matching '{prefix}' in #{ch_id}.")
-                return
-            event = {
-                "t": "CHANNEL_EVT", "op": "approve",
-                "circle_id": self._current_circle_id, "channel_id": ch_id,
-                "actor_node_id": self.state.node.node_id,
-                "target_node_id": full_id,
-            }
-            apply_channel_event(self.state, self._current_circle_id, event)
-            msg = make_channel_event_message(self.state, self._current_circle_id, event)
-            if msg:
-                self.state.messages[msg.msg_id] = msg
-                self._seen.add(msg.msg_id)
-            async with self.node._lock:
-                save_state(self.state)
-            display = self.state.node_display_names.get(full_id, full_id[:8])
-            self._log_system(f"Approved {display} [{full_id[:8]}] to join #{ch_id}.")
+    async def _channel_leave(self, args: list, cv: CircleView) -> None:
+        if len(args) < 2:
+            self._log_system("Usage: /channel leave <name>")
+            return
+        ch_id = args[1].lower()
+        if ch_id == "general":
+            self._log_system("Cannot leave #general.")
+            return
+        cv.members.get(ch_id, set()).discard(self.state.node.node_id)
+        self._schedule_save()
+        if self._current_channel == ch_id:
+            self._current_channel = "general"
+            self._seen.clear()
+            self._message_log.clear()
+            self._load_history()
+        self._refresh_sidebar()
+        self._log_system(f"Left #{ch_id}.")
 
+    async def _channel_requests(self, args: list, cv: CircleView) -> None:
+        if len(args) < 2:
+            self._log_system("Usage: /channel requests <name>")
+            return
+        ch_id = args[1].lower()
+        if ch_id not in cv.channels:
+            self._log_system(f"Unknown channel #{ch_id}.")
+            return
+        if cv.channels[ch_id].created_by != self.state.node.node_id:
+            self._log_system("Only the channel owner can view pending requests.")
+            return
+        reqs = sorted(cv.requests.get(ch_id, set()))
+        if not reqs:
+            self._log_system(f"#{ch_id} — no pending requests.")
         else:
-            self._log_system("Usage: /channel create|join|switch|leave|requests|approve <name>")
+            self._log_system(f"#{ch_id} — {len(reqs)} pending request(s):")
+            for nid in reqs:
+                display = self.state.node_display_names.get(nid, nid[:8])
+                self._log_system(f"  {display} [{nid[:8]}]")
+
+    async def _channel_approve(self, args: list, cv: CircleView) -> None:
+        if len(args) < 3:
+            self._log_system("Usage: /channel approve <name> <node_id>")
+            return
+        ch_id, prefix = args[1].lower(), args[2]
+        if ch_id not in cv.channels:
+            self._log_system(f"Unknown channel #{ch_id}.")
+            return
+        if cv.channels[ch_id].created_by != self.state.node.node_id:
+            self._log_system("Only the channel owner can approve requests.")
+            return
+        full_id = next(
+            (nid for nid in cv.requests.get(ch_id, set()) if nid.startswith(prefix)),
+            None,
+        )
+        if not full_id:
+            self._log_system(f"No pending request matching '{prefix}' in #{ch_id}.")
+            return
+        event = {
+            "t": "CHANNEL_EVT", "op": "approve",
+            "circle_id": self._current_circle_id, "channel_id": ch_id,
+            "actor_node_id": self.state.node.node_id,
+            "target_node_id": full_id,
+        }
+        apply_channel_event(self.state, self._current_circle_id, event)
+        msg = make_channel_event_message(self.state, self._current_circle_id, event)
+        if msg:
+            self.state.messages[msg.msg_id] = msg
+            self._seen.add(msg.msg_id)
+        self._schedule_save()
+        display = self.state.node_display_names.get(full_id, full_id[:8])
+        self._log_system(f"Approved {display} [{full_id[:8]}] to join #{ch_id}.")
@@ -2,15 +2,59 @@
 from __future__ import annotations
 
 import asyncio
+import time
+from collections import OrderedDict
+from functools import partial
+from typing import Dict, Sequence, Tuple
 
+from rich.text import Text
+from textual import on
 from textual.app import ComposeResult
 from textual.binding import Binding
-from textual.containers import Vertical
+from textual.containers import Horizontal, Vertical
 from textual.screen import ModalScreen
 from textual.widgets import Button, Input, Label, RichLog
 
 from ._utils import _try_copy_to_clipboard
 
+# Parsed help text keyed by its markup source.  RichLog defers rendering
+# until its size is known and wraps to the current width, so the markup parse
+# is the part worth reusing across openings of the modal.
+_HELP_RENDER_CACHE: OrderedDict[Tuple[str, ...], Text] = OrderedDict()
+_HELP_RENDER_CACHE_MAX = 4
+
+
+def _parsed_help_text(lines: Sequence[str]) -> Text:
+    """Return *lines* parsed from Rich markup as one Text, memoized (LRU, 4 entries)."""
+    key = tuple(lines)
+    parsed = _HELP_RENDER_CACHE.get(key)
+    if parsed is None:
+        parsed = Text("\n").join(Text.from_markup(line) for line in key)
+        _HELP_RENDER_CACHE[key] = parsed
+        if len(_HELP_RENDER_CACHE) > _HELP_RENDER_CACHE_MAX:
+            _HELP_RENDER_CACHE.popitem(last=False)
+    else:
+        _HELP_RENDER_CACHE.move_to_end(key)
+    return parsed
+
+
+# Successful /v1/health responses by relay URL, so repeated "Test" clicks
+# answer instantly instead of paying another TLS handshake + round trip.
+_HEALTH_CACHE: Dict[str, Tuple[float, dict]] = {}
+_HEALTH_CACHE_TTL_S = 5.0
+_HEALTH_CACHE_MAX_AGE_S = 60.0
+
+
+def _cached_health(url: str) -> dict | None:
+    """Return a fresh cached health response for *url*, evicting stale entries."""
+    now = time.monotonic()
+    for key in [k for k, (ts, _) in _HEALTH_CACHE.items() if now - ts > _HEALTH_CACHE_MAX_AGE_S]:
+        del _HEALTH_CACHE[key]
+    entry = _HEALTH_CACHE.get(url)
+    if entry and now - entry[0] < _HEALTH_CACHE_TTL_S:
+        return entry[1]
+    return None
+
 
 class SettingsModal(ModalScreen):
     """F3 / /settings — edit display name and rendezvous URL."""
@@ -65,9 +109,11 @@ class SettingsModal(ModalScreen):
         self._display_name = display_name
         self._rendezvous_base = rendezvous_base
         self._node_id = node_id
+        # Normalized field values, kept current by the Input.Changed handlers.
+        self._display_name_normalized = display_name.strip()
+        self._rendezvous_base_normalized = rendezvous_base.strip().rstrip("/")
 
     def compose(self) -> ComposeResult:
-        from textual.containers import Horizontal
         with Vertical(id="settings-box"):
             yield Label("Settings", id="settings-title")
             yield Label(f"Node ID: {self._node_id}", id="settings-label-node")
@@ -88,26 +134,44 @@ class SettingsModal(ModalScreen):
     async def on_mount(self) -> None:
         self.query_one("#input-display-name", Input).focus()
 
+    @on(Input.Changed, "#input-display-name")
+    def _display_name_changed(self, event: Input.Changed) -> None:
+        self._display_name_normalized = event.value.strip()
+
+    @on(Input.Changed, "#input-rendezvous")
+    def _rendezvous_changed(self, event: Input.Changed) -> None:
+        self._rendezvous_base_normalized = event.value.strip().rstrip("/")
+
     async def on_button_pressed(self, event: Button.Pressed) -> None:
         if event.button.id == "btn-settings-save":
-            display_name = self.query_one("#input-display-name", Input).value.strip() or "anon"
-            rendezvous_base = self.query_one("#input-rendezvous", Input).value.strip().rstrip("/")
-            self.dismiss({"display_name": display_name, "rendezvous_base": rendezvous_base})
+            self.dismiss({
+                "display_name": self._display_name_normalized or "anon",
+                "rendezvous_base": self._rendezvous_base_normalized,
+            })
         elif event.button.id == "btn-settings-cancel":
             self.dismiss(None)
         elif event.button.id == "btn-settings-test":
-            await self._test_connection()
+            # A new click cancels any check still in flight, so a slow earlier
+            # response can't overwrite the status of the latest one.
+            self.run_worker(self._test_connection(), exclusive=True, group="settings-test")
 
     async def _test_connection(self) -> None:
         status = self.query_one("#settings-status", Label)
-        url = self.query_one("#input-rendezvous", Input).value.strip().rstrip("/")
+        url = self._rendezvous_base_normalized
         if not url:
             status.update("[red]Enter a URL first.[/red]")
             return
-        status.update("[dim]Testing…[/dim]")
         try:
-            from felundchat.rendezvous_client import _api_request
-            data = await asyncio.to_thread(_api_request, "GET", f"{url}/v1/health")
+            data = _cached_health(url)
+            if data is None:
+                status.update("[dim]Testing…[/dim]")
+                from felundchat.rendezvous_client import _api_request
+                # Shorter than _api_request's 8 s default: a user is waiting on
+                # this one, and a newer click cancels it anyway.
+                data = await asyncio.get_running_loop().run_in_executor(
+                    None, partial(_api_request, "GET", f"{url}/v1/health", timeout=5)
+                )
+                _HEALTH_CACHE[url] = (time.monotonic(), data)
             version = data.get("version", "?")
             server_time = data.get("time", 0)
             status.update(f"[green]OK — v{version}  (server time {server_time})[/green]")
@@ -166,7 +230,6 @@ class InviteModal(ModalScreen):
         self._code = code
 
     def compose(self) -> ComposeResult:
-        from textual.containers import Horizontal
         with Vertical(id="invite-box"):
             yield Label("Invite Code", id="invite-modal-title")
             yield Input(value=self._code, id="invite-code-input")
@@ -178,21 +241,28 @@ class InviteModal(ModalScreen):
 
     async def on_mount(self) -> None:
         self.query_one("#invite-code-input", Input).focus()
-        await self._do_copy()
+        # Copy in the background so the modal paints before the OSC 52 write.
+        self.run_worker(self._do_copy(), exclusive=True, name="invite-copy")
 
     async def _do_copy(self) -> None:
         status = self.query_one("#invite-status", Label)
         # Primary: OSC 52 — built into Textual, works in GNOME Terminal,
         # Windows Terminal, kitty, iTerm2, and most modern terminal emulators
-        # without any external tools.
-        try:
-            self.app.copy_to_clipboard(self._code)
-            status.update("[green]Copied to clipboard[/green]")
-            return
-        except Exception:
-            pass
+        # without any external tools. Textual emits the escape sequence
+        # unconditionally, so only a failed write to the terminal can raise.
+        if hasattr(self.app, "copy_to_clipboard"):
+            try:
+                self.app.copy_to_clipboard(self._code)
+            except OSError:
+                pass
+            else:
+                status.update("[green]Copied to clipboard[/green]")
+                return
         # Fallback: try system clipboard tools (xclip, wl-copy, clip.exe, …)
-        copied = await asyncio.to_thread(_try_copy_to_clipboard, self._code)
+        executor = getattr(self.app, "_clipboard_executor", None)
+        copied = await asyncio.get_running_loop().run_in_executor(
+            executor, _try_copy_to_clipboard, self._code
+        )
         if copied:
             status.update("[green]Copied to clipboard[/green]")
         else:
@@ -240,7 +310,7 @@ class HelpModal(ModalScreen):
     }
     """
 
-    def __init__(self, lines: list, title: str = "felundchat — commands", **kwargs) -> None:
+    def __init__(self, lines: Sequence[str], title: str = "felundchat — commands", **kwargs) -> None:
         super().__init__(**kwargs)
         self._lines = lines
         self._title = title
@@ -253,8 +323,8 @@ class HelpModal(ModalScreen):
 
     async def on_mount(self) -> None:
         log = self.query_one("#help-log", RichLog)
-        for line in self._lines:
-            log.write(line)
+        # One write: RichLog shapes the block once and updates its size once.
+        log.write(_parsed_help_text(self._lines))
         log.scroll_home(animate=False)
         self.query_one("#btn-help-close", Button).focus()
 
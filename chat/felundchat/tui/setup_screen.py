@@ -1,20 +1,40 @@
 """First-run wizard screen: host a new circle or join an existing one."""
 from __future__ import annotations
 
-from typing import Optional
+import asyncio
+from typing import Optional, Tuple
 
+from rich.text import Text
 from textual.app import ComposeResult
 from textual.containers import Horizontal, Vertical
+from textual.reactive import reactive
 from textual.screen import Screen
 from textual.widgets import Button, Footer, Input, Label
 
 from felundchat.chat import create_circle, ensure_default_channel
 from felundchat.crypto import sha256_hex
-from felundchat.invite import is_relay_url, make_felund_code, parse_felund_code
+from felundchat.invite import (
+    is_relay_url,
+    looks_like_felund_code,
+    make_felund_code,
+    parse_felund_code,
+)
 from felundchat.models import Circle
 from felundchat.persistence import load_state, save_state
 from felundchat.transport import detect_local_ip, public_addr_hint
 
+# chat_screen only pulls in setup_screen lazily (from /circle leave), so the
+# import is one-way at module scope and ChatScreen is warm before Start.
+from .chat_screen import ChatScreen
+
+# Static label text, built once and shared by every SetupScreen instance.
+_LBL_WELCOME = Text("Welcome to felundchat")
+_LBL_HOW = Text("How would you like to start?")
+_LBL_DISPLAY_NAME = Text("Display name:")
+_LBL_PORT = Text("Listen port:")
+_LBL_CIRCLE_NAME = Text("Circle name (optional):")
+_LBL_CODE = Text("Invite code:")
+
 
 class SetupScreen(Screen):
     """First-run wizard: host a new circle or join an existing one."""
@@ -45,7 +65,11 @@ class SetupScreen(Screen):
         margin-top: 1;
         color: $text-muted;
     }
-    .hidden {
+    /* Mode-specific fields: one class on the screen decides what is shown. */
+    SetupScreen.host-mode #label-code,
+    SetupScreen.host-mode #input-code,
+    SetupScreen.join-mode #label-circle-name,
+    SetupScreen.join-mode #input-circle-name {
         display: none;
     }
     #input-circle-name {
@@ -62,61 +86,65 @@ class SetupScreen(Screen):
     }
     """
 
-    _mode: str = "host"
+    DEFAULT_CLASSES = "host-mode"
+
+    # "host" or "join"; watch_mode swaps the screen's mode class.
+    mode: reactive[str] = reactive("host", init=False)
 
     def compose(self) -> ComposeResult:
         with Vertical(id="setup-box"):
-            yield Label("Welcome to felundchat", id="setup-title")
-            yield Label("How would you like to start?")
+            yield Label(_LBL_WELCOME, id="setup-title")
+            yield Label(_LBL_HOW)
             with Horizontal(classes="mode-row"):
                 yield Button("Host new circle", id="btn-host", classes="mode-btn", variant="primary")
                 yield Button("Join with invite code", id="btn-join", classes="mode-btn")
-            yield Label("Display name:", classes="field-label")
+            yield Label(_LBL_DISPLAY_NAME, classes="field-label")
             yield Input(placeholder="anon", id="input-name")
-            yield Label("Listen port:", classes="field-label")
+            yield Label(_LBL_PORT, classes="field-label")
             yield Input(value="9999", id="input-port")
-            yield Label("Circle name (optional):", id="label-circle-name", classes="field-label")
+            yield Label(_LBL_CIRCLE_NAME, id="label-circle-name", classes="field-label")
             yield Input(placeholder="e.g. family, work, game night", id="input-circle-name")
-            yield Label("Invite code:", id="label-code", classes="field-label hidden")
-            yield Input(placeholder="felund1....", id="input-code", classes="hidden")
+            yield Label(_LBL_CODE, id="label-code", classes="field-label")
+            yield Input(placeholder="felund1....", id="input-code")
             yield Label("", id="error-msg")
             yield Button("Start", id="btn-start", variant="success")
         yield Footer()
 
+    def on_mount(self) -> None:
+        # Widgets are looked up once; the handlers below reuse these references.
+        self._btn_host = self.query_one("#btn-host", Button)
+        self._btn_join = self.query_one("#btn-join", Button)
+        self._input_name = self.query_one("#input-name", Input)
+        self._input_port = self.query_one("#input-port", Input)
+        self._input_circle_name = self.query_one("#input-circle-name", Input)
+        self._input_code = self.query_one("#input-code", Input)
+        self._error_msg = self.query_one("#error-msg", Label)
+        self._btn_start = self.query_one("#btn-start", Button)
+
     async def on_button_pressed(self, event: Button.Pressed) -> None:
         bid = event.button.id
         if bid == "btn-host":
-            self._mode = "host"
-            self.query_one("#btn-host").variant = "primary"
-            self.query_one("#btn-join").variant = "default"
-            self.query_one("#input-code").add_class("hidden")
-            self.query_one("#label-code").add_class("hidden")
-            self.query_one("#input-circle-name").remove_class("hidden")
-            self.query_one("#label-circle-name").remove_class("hidden")
+            self.mode = "host"
         elif bid == "btn-join":
-            self._mode = "join"
-            self.query_one("#btn-join").variant = "primary"
-            self.query_one("#btn-host").variant = "default"
-            self.query_one("#input-code").remove_class("hidden")
-            self.query_one("#label-code").remove_class("hidden")
-            self.query_one("#input-circle-name").add_class("hidden")
-            self.query_one("#label-circle-name").add_class("hidden")
+            self.mode = "join"
         elif bid == "btn-start":
             await self._do_start()
 
+    def watch_mode(self, mode: str) -> None:
+        self.remove_class("host-mode", "join-mode")
+        self.add_class(f"{mode}-mode")
+        self._btn_host.variant = "primary" if mode == "host" else "default"
+        self._btn_join.variant = "primary" if mode == "join" else "default"
+
     def _show_error(self, msg: str) -> None:
-        self.query_one("#error-msg", Label).update(msg)
+        self._error_msg.update(msg)
 
     async def _do_start(self) -> None:
-        # Local import breaks the setup_screen ↔ chat_screen circular dependency.
-        from .chat_screen import ChatScreen
-
-        state = load_state()
-
-        name = self.query_one("#input-name", Input).value.strip() or "anon"
-        state.node.display_name = name
-
-        port_raw = self.query_one("#input-port", Input).value.strip()
+        # A second Start (or Enter) queued while the first is still awaiting
+        # the executor must not launch a second session on the same port.
+        if self._btn_start.disabled:
+            return
+        port_raw = self._input_port.value.strip()
         try:
             port = int(port_raw)
             if not (1 <= port <= 65535):
@@ -124,37 +152,65 @@ class SetupScreen(Screen):
         except ValueError:
             self._show_error("Invalid port number (1-65535).")
             return
+
+        # Validate the invite code up front so a typo fails before any disk
+        # or socket work.
+        invite: Optional[Tuple[str, str]] = None
+        if self.mode == "join":
+            code_val = self._input_code.value.strip()
+            if not looks_like_felund_code(code_val):
+                self._show_error("Invalid invite code: expected felund1.…")
+                return
+            try:
+                invite = parse_felund_code(code_val)
+            except Exception as e:
+                self._show_error(f"Invalid invite code: {e}")
+                return
+
+        self._btn_start.disabled = True
+        self._show_error("[dim]Starting…[/dim]")
+        try:
+            await self._launch(port, invite)
+        except Exception as e:
+            self._btn_start.disabled = False
+            self._show_error(f"Could not start: {e}")
+
+    async def _launch(self, port: int, invite: Optional[Tuple[str, str]]) -> None:
+        # Disk and socket work runs in the executor so the screen keeps painting.
+        loop = asyncio.get_running_loop()
+        state = await loop.run_in_executor(None, load_state)
+
+        name = self._input_name.value.strip() or "anon"
+        state.node.display_name = name
         state.node.port = port
-        state.node.bind = detect_local_ip()
+        state.node.bind = await loop.run_in_executor(None, detect_local_ip)
 
         initial_msg: Optional[str] = None
         initial_invite_code: Optional[str] = None
         bootstrap_peer: Optional[str] = None
         bootstrap_circle: Optional[str] = None
 
-        if self._mode == "host":
+        if self.mode == "host":
             circle = create_circle(state)
-            circle_name = self.query_one("#input-circle-name", Input).value.strip()
+            circle_name = self._input_circle_name.value.strip()
             if circle_name:
                 circle.name = circle_name
-            save_state(state)
+            await loop.run_in_executor(None, save_state, state)
             addr = public_addr_hint(state.node.bind, state.node.port)
             initial_invite_code = make_felund_code(circle.secret_hex, addr)
             label = f'"{circle_name}"' if circle_name else circle.circle_id[:8]
             initial_msg = f"Circle {label} created! Share the invite code with friends."
         else:
-            code_val = self.query_one("#input-code", Input).value.strip()
-            try:
-                secret_hex, peer_addr = parse_felund_code(code_val)
-            except Exception as e:
-                self._show_error(f"Invalid invite code: {e}")
-                return
+            secret_hex, peer_addr = invite
             secret = bytes.fromhex(secret_hex)
             circle_id = sha256_hex(secret)[:24]
             state.circles[circle_id] = Circle(circle_id=circle_id, secret_hex=secret_hex)
-            state.circle_members.setdefault(circle_id, set()).add(state.node.node_id)
+            members = state.circle_members.get(circle_id)
+            if members is None:
+                members = state.circle_members[circle_id] = set()
+            members.add(state.node.node_id)
             ensure_default_channel(state, circle_id)
-            save_state(state)
+            await loop.run_in_executor(None, save_state, state)
             # Web-client codes carry a relay URL instead of a TCP address.
             # In that case skip the direct TCP bootstrap; the relay loop handles it.
             bootstrap_peer = peer_addr if not is_relay_url(peer_addr) else None
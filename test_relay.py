@@ -7,7 +7,7 @@ Simulates 1 host + 3 clients all exchanging messages through the relay server.
 Tests
 -----
 1. Health check
-2. Sequential pushes (one per node)
+2. Batched push (all 4 nodes' messages in one request)
 3. Concurrent pushes (all 4 nodes push simultaneously — stress-tests SQLite locking)
 4. Full pull: every node pulls with since=0 and verifies it receives all 4 messages
 5. MAC verification: each received message is verified with the shared secret
@@ -27,6 +27,7 @@ from __future__ import annotations
 
 import hashlib
 import hmac as _hmac
+import http.client
 import json
 import os
 import secrets
@@ -34,9 +35,41 @@ import sys
 import threading
 import time
 import urllib.error
-import urllib.request
+import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import List, Optional
+from functools import lru_cache, partial
+from operator import itemgetter
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+# Optional faster JSON codecs; the test runs fine on the stdlib alone.
+try:
+    import orjson
+
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+except ImportError:
+    try:
+        import ujson
+
+        def _dumps(obj: object) -> bytes:
+            return ujson.dumps(obj).encode("utf-8")
+
+        _loads = ujson.loads
+    except ImportError:
+        def _dumps(obj: object) -> bytes:
+            return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+        _loads = json.loads
+
+# Optional streaming parser for large pull responses.
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# Below this size a full parse is cheaper than streaming.
+_STREAM_PARSE_MIN_BYTES = 64 * 1024
 
 
 # ── Crypto (mirrors Python client & JS client exactly) ────────────────────────
@@ -45,17 +78,39 @@ def sha256_hex(data: bytes) -> str:
     return hashlib.sha256(data).hexdigest()
 
 
-def hmac_hex(key_hex: str, message: str) -> str:
-    key = bytes.fromhex(key_hex)
-    return _hmac.new(key, message.encode("utf-8"), hashlib.sha256).hexdigest()
+def hmac_digest_bytes(key: bytes, msg: bytes) -> bytes:
+    return _hmac.digest(key, msg, "sha256")
 
 
+@lru_cache(maxsize=1024)
 def circle_hint_for(circle_id: str) -> str:
     return sha256_hex(circle_id.encode("utf-8"))[:16]
 
 
-def make_mac(
-    secret_hex: str,
+def make_mac_digest(
+    key: bytes,
+    msg_id: str,
+    circle_id: str,
+    channel_id: str,
+    author_node_id: str,
+    display_name: str,
+    created_ts: int,
+    text: str,
+) -> bytes:
+    payload = b"|".join((
+        msg_id.encode(),
+        circle_id.encode(),
+        channel_id.encode(),
+        author_node_id.encode(),
+        display_name.encode("utf-8"),
+        str(created_ts).encode(),
+        text.encode("utf-8"),
+    ))
+    return hmac_digest_bytes(key, payload)
+
+
+def make_mac_hex(
+    key: bytes,
     msg_id: str,
     circle_id: str,
     channel_id: str,
@@ -64,26 +119,125 @@ def make_mac(
     created_ts: int,
     text: str,
 ) -> str:
-    payload = f"{msg_id}|{circle_id}|{channel_id}|{author_node_id}|{display_name}|{created_ts}|{text}"
-    return hmac_hex(secret_hex, payload)
+    return make_mac_digest(
+        key, msg_id, circle_id, channel_id, author_node_id, display_name, created_ts, text,
+    ).hex()
+
+
+_MAC_HEX_LEN = 64  # hex-encoded HMAC-SHA256
+
+# Fields of a pulled message that feed its MAC, in make_mac_digest argument order.
+_MAC_FIELDS = itemgetter(
+    "msg_id", "circle_id", "channel_id", "author_node_id", "display_name", "created_ts", "text",
+)
 
 
 # ── HTTP helper ───────────────────────────────────────────────────────────────
 
+# One keep-alive connection per (scheme, host:port) per thread, so repeated
+# calls skip the TCP/TLS handshake and concurrent pushes still hit the server
+# in parallel.
+_local = threading.local()
+
+
+def _connection(scheme: str, netloc: str, timeout: int) -> http.client.HTTPConnection:
+    pool: Dict[Tuple[str, str], http.client.HTTPConnection] = getattr(_local, "conns", None)
+    if pool is None:
+        pool = _local.conns = {}
+    conn = pool.get((scheme, netloc))
+    if conn is None:
+        cls = http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+        conn = pool[(scheme, netloc)] = cls(netloc, timeout=timeout)
+    return conn
+
+
+def _drop_connection(scheme: str, netloc: str) -> None:
+    conn = _local.conns.pop((scheme, netloc), None)
+    if conn is not None:
+        conn.close()
+
+
+def _parse_json(resp: http.client.HTTPResponse) -> Any:
+    return _loads(resp.read())
+
+
+def _send(
+    conn: http.client.HTTPConnection,
+    method: str,
+    path: str,
+    raw: Optional[bytes],
+    headers: dict,
+    parse: Callable[[http.client.HTTPResponse], Any],
+) -> Tuple[http.client.HTTPResponse, Any]:
+    conn.request(method, path, body=raw, headers=headers)
+    resp = conn.getresponse()
+    if resp.status >= 400:
+        resp.read()
+        return resp, None
+    return resp, parse(resp)
+
+
+# The relay base URL, split once so each request only appends a path.
+@dataclass(frozen=True)
+class Relay:
+    scheme: str
+    netloc: str
+    base_path: str
+
+    @classmethod
+    def parse(cls, api_base: str) -> Relay:
+        parts = urllib.parse.urlsplit(api_base.rstrip("/"))
+        return cls(parts.scheme, parts.netloc, parts.path)
+
+    def url(self, path: str) -> str:
+        return f"{self.scheme}://{self.netloc}{self.base_path}{path}"
+
+
 def api_call(
     method: str,
-    url: str,
+    relay: Relay,
+    path: str,
     body: Optional[dict] = None,
     node_id: str = "",
     timeout: int = 15,
 ) -> dict:
-    raw = json.dumps(body, separators=(",", ":")).encode() if body is not None else None
-    headers: dict = {"content-type": "application/json"}
+    raw = _dumps(body) if body is not None else None
+    return api_call_raw(method, relay, path, raw, node_id=node_id, timeout=timeout)
+
+
+def api_call_raw(
+    method: str,
+    relay: Relay,
+    path: str,
+    raw: Optional[bytes] = None,
+    node_id: str = "",
+    timeout: int = 15,
+    parse: Callable[[http.client.HTTPResponse], Any] = _parse_json,
+) -> Any:
+    headers: dict = {"content-type": "application/json", "Connection": "keep-alive"}
     if node_id:
         headers["X-Felund-Node"] = node_id
-    req = urllib.request.Request(url=url, data=raw, headers=headers, method=method)
-    with urllib.request.urlopen(req, timeout=timeout) as resp:
-        return json.loads(resp.read().decode("utf-8"))
+    scheme, netloc = relay.scheme, relay.netloc
+    full_path = relay.base_path + path
+    try:
+        try:
+            resp, data = _send(
+                _connection(scheme, netloc, timeout), method, full_path, raw, headers, parse,
+            )
+        except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+            # The server closed an idle keep-alive connection; retry once on a fresh one.
+            _drop_connection(scheme, netloc)
+            resp, data = _send(
+                _connection(scheme, netloc, timeout), method, full_path, raw, headers, parse,
+            )
+    except Exception:
+        _drop_connection(scheme, netloc)
+        raise
+    if resp.will_close:
+        _drop_connection(scheme, netloc)
+    if resp.status >= 400:
+        raise urllib.error.HTTPError(relay.url(path), resp.status, resp.reason, resp.headers, None)
+    return data
 
 
 # ── Simulated node ────────────────────────────────────────────────────────────
@@ -93,6 +247,7 @@ class Node:
     name: str
     node_id: str
     secret_hex: str
+    secret_key: bytes
     circle_id: str
     hint: str
     msg_id: str
@@ -105,6 +260,21 @@ class Node:
     pull_msgs: List[dict] = field(default_factory=list)
     pull_ms: float = 0.0
     pull_error: str = ""
+    push_body: bytes = b""  # serialized POST /v1/messages body, set by make_node
+    pull_path_prefix: str = ""  # GET /v1/messages path up to the since= value
+
+
+def message_body(node: Node) -> dict:
+    return {
+        "msg_id": node.msg_id,
+        "circle_id": node.circle_id,
+        "channel_id": "general",
+        "author_node_id": node.node_id,
+        "display_name": node.name,
+        "created_ts": node.created_ts,
+        "text": node.text,
+        "mac": node.mac,
+    }
 
 
 def make_node(name: str, secret_hex: str, circle_id: str, hint: str) -> Node:
@@ -113,11 +283,13 @@ def make_node(name: str, secret_hex: str, circle_id: str, hint: str) -> Node:
     rand = secrets.token_hex(8)
     msg_id = sha256_hex(f"{node_id}|{created_ts}|{rand}".encode())[:32]
     text = f"Test message from {name} at t={created_ts}"
-    mac = make_mac(secret_hex, msg_id, circle_id, "general", node_id, name, created_ts, text)
-    return Node(
+    secret_key = bytes.fromhex(secret_hex)
+    mac = make_mac_hex(secret_key, msg_id, circle_id, "general", node_id, name, created_ts, text)
+    node = Node(
         name=name,
         node_id=node_id,
         secret_hex=secret_hex,
+        secret_key=secret_key,
         circle_id=circle_id,
         hint=hint,
         msg_id=msg_id,
@@ -125,51 +297,107 @@ def make_node(name: str, secret_hex: str, circle_id: str, hint: str) -> Node:
         created_ts=created_ts,
         mac=mac,
     )
+    node.push_body = _dumps({"circle_hint": hint, "messages": [message_body(node)]})
+    node.pull_path_prefix = f"/v1/messages?circle_hint={hint}&limit=200&since="
+    return node
 
 
 # ── Per-node push / pull operations ──────────────────────────────────────────
 
-def push_node(node: Node, api_base: str) -> None:
-    url = f"{api_base}/v1/messages"
-    body = {
-        "circle_hint": node.hint,
-        "messages": [{
-            "msg_id": node.msg_id,
-            "circle_id": node.circle_id,
-            "channel_id": "general",
-            "author_node_id": node.node_id,
-            "display_name": node.name,
-            "created_ts": node.created_ts,
-            "text": node.text,
-            "mac": node.mac,
-        }],
-    }
-    t0 = time.monotonic()
+def push_node(node: Node, relay: Relay) -> None:
+    t0 = time.monotonic_ns()
     try:
-        resp = api_call("POST", url, body, node_id=node.node_id)
-        node.push_ms = (time.monotonic() - t0) * 1000
+        resp = api_call_raw("POST", relay, "/v1/messages", node.push_body, node_id=node.node_id)
+        node.push_ms = (time.monotonic_ns() - t0) / 1_000_000
         if resp.get("ok"):
             node.push_ok = True
         else:
             node.push_error = f"server returned ok=false: {resp}"
     except Exception as exc:
-        node.push_ms = (time.monotonic() - t0) * 1000
+        node.push_ms = (time.monotonic_ns() - t0) / 1_000_000
         node.push_error = str(exc)
 
 
-def pull_node(node: Node, api_base: str, since: int = 0) -> None:
-    params = f"circle_hint={node.hint}&since={since}&limit=200"
-    url = f"{api_base}/v1/messages?{params}"
-    t0 = time.monotonic()
+def push_nodes_batched(nodes: List[Node], relay: Relay) -> None:
+    body = {"circle_hint": nodes[0].hint, "messages": [message_body(n) for n in nodes]}
+    t0 = time.monotonic_ns()
+    error = ""
+    try:
+        resp = api_call("POST", relay, "/v1/messages", body, node_id=nodes[0].node_id)
+        if not resp.get("ok"):
+            error = f"server returned ok=false: {resp}"
+    except Exception as exc:
+        error = str(exc)
+    elapsed_ms = (time.monotonic_ns() - t0) / 1_000_000
+    for n in nodes:
+        n.push_ms = elapsed_ms
+        n.push_ok = not error
+        n.push_error = error
+
+
+def _parse_pull(resp: http.client.HTTPResponse, circle_id: str) -> List[dict]:
+    # Large histories are streamed one message at a time when ijson is
+    # available; either way only this circle's messages are kept.
+    length = int(resp.getheader("Content-Length") or 0)
+    if ijson is not None and length > _STREAM_PARSE_MIN_BYTES:
+        msgs = [
+            m for m in ijson.items(resp, "messages.item", use_float=True)
+            if m.get("circle_id") == circle_id
+        ]
+        resp.read()  # drain anything after the array so the connection stays usable
+        return msgs
+    return [m for m in _loads(resp.read()).get("messages", []) if m.get("circle_id") == circle_id]
+
+
+def pull_node(node: Node, relay: Relay, since: int = 0) -> None:
+    path = node.pull_path_prefix + str(since)
+    t0 = time.monotonic_ns()
     try:
-        resp = api_call("GET", url, node_id=node.node_id)
-        node.pull_ms = (time.monotonic() - t0) * 1000
-        node.pull_msgs = resp.get("messages", [])
+        node.pull_msgs = api_call_raw(
+            "GET", relay, path, node_id=node.node_id,
+            parse=partial(_parse_pull, circle_id=node.circle_id),
+        )
+        node.pull_ms = (time.monotonic_ns() - t0) / 1_000_000
     except Exception as exc:
-        node.pull_ms = (time.monotonic() - t0) * 1000
+        node.pull_ms = (time.monotonic_ns() - t0) / 1_000_000
         node.pull_error = str(exc)
 
 
+def verify_node(node: Node, expected_ids: Set[str]) -> Tuple[List[dict], Set[str], List[str]]:
+    our_msgs = [m for m in node.pull_msgs if m.get("circle_id") == node.circle_id]
+    missing = expected_ids - {m["msg_id"] for m in our_msgs}
+
+    mac_fails: List[str] = []
+    key = node.secret_key
+    mac_of, mac_fields = make_mac_digest, _MAC_FIELDS
+    for m in our_msgs:
+        mid = m["msg_id"]
+        if mid not in expected_ids:
+            continue  # older msgs from prior test runs, skip
+        recv_mac = m.get("mac") or ""
+        if len(recv_mac) != _MAC_HEX_LEN:
+            mac_fails.append(mid[:10])  # malformed; no need to compute the HMAC
+            continue
+        try:
+            received = bytes.fromhex(recv_mac)
+        except ValueError:
+            received = b""
+        if not _hmac.compare_digest(mac_of(key, *mac_fields(m)), received):
+            mac_fails.append(mid[:10])
+    return our_msgs, missing, mac_fails
+
+
+def wait_for_server_time(relay: Relay, target: int, max_wait_s: float = 1.5) -> bool:
+    # Polls instead of sleeping a full second: the server's clock usually
+    # ticks over well before that. False if it never reached *target*.
+    deadline = time.monotonic() + max_wait_s
+    while time.monotonic() < deadline:
+        time.sleep(0.1)
+        if int(api_call("GET", relay, "/v1/health").get("time", 0)) >= target:
+            return True
+    return False
+
+
 # ── Result helpers ────────────────────────────────────────────────────────────
 
 PASS = "PASS"
@@ -198,8 +426,96 @@ def section(title: str) -> None:
     print(f"\n── {title} {'─' * max(0, 55 - len(title))}")
 
 
+def _cursor_section(
+    relay: Relay,
+    pool: ThreadPoolExecutor,
+    nodes: List[Node],
+    expected_ids: Set[str],
+    secret_hex: str,
+    circle_id: str,
+    hint: str,
+) -> bool:
+    # Record server time as the cursor BEFORE pushing new messages
+    try:
+        h2 = api_call("GET", relay, "/v1/health")
+    except Exception as exc:
+        status_line("cursor captured", FAIL, str(exc))
+        return False
+    cursor = int(h2.get("time", 0))
+    status_line("cursor captured", PASS, f"cursor={cursor}")
+
+    cursor_nodes = [
+        make_node("cursor-A", secret_hex, circle_id, hint),
+        make_node("cursor-B", secret_hex, circle_id, hint),
+    ]
+
+    # stored_at is stamped at push time, so wait until the server clock has
+    # moved past the cursor second before pushing
+    try:
+        advanced = wait_for_server_time(relay, cursor + 1)
+    except Exception as exc:
+        status_line("server clock advanced", FAIL, str(exc))
+        return False
+    if not advanced:
+        # Pushing now would report MISSING_NEW for a clock problem instead.
+        status_line("server clock advanced", FAIL, f"server time did not pass cursor={cursor}")
+        return False
+
+    list(pool.map(lambda cn: push_node(cn, relay), cursor_nodes))
+
+    push_status = PASS if all(not cn.push_error for cn in cursor_nodes) else FAIL
+    status_line("push 2 new msgs", push_status, "  ".join(
+        f"{cn.name}={cn.push_ms:.0f}ms {'ERR:'+cn.push_error if cn.push_error else 'ok'}"
+        for cn in cursor_nodes
+    ))
+    cursor_ok = push_status == PASS
+
+    expected_new = {cn.msg_id for cn in cursor_nodes}
+
+    for n in nodes[:2]:  # test from two original nodes' perspectives
+        pull_node(n, relay, since=cursor)
+        if n.pull_error:
+            status_line(f"{n.name} (since={cursor})", FAIL, n.pull_error)
+            cursor_ok = False
+            continue
+
+        missing_new = set(expected_new)
+        old_leaked = set()  # original msgs should NOT appear
+        for m in n.pull_msgs:
+            if m.get("circle_id") != circle_id:
+                continue
+            mid = m["msg_id"]
+            missing_new.discard(mid)
+            if mid in expected_ids:
+                old_leaked.add(mid)
+
+        notes = [f"got={len(n.pull_msgs)}"]
+        st = PASS
+        if missing_new:
+            notes.append(f"MISSING_NEW={[i[:10] for i in missing_new]}")
+            st = FAIL
+        if old_leaked:
+            # This means the cursor didn't filter — server bug
+            notes.append(f"OLD_MSGS_LEAKED={[i[:10] for i in old_leaked]}")
+            st = FAIL
+
+        status_line(f"{n.name} (since={cursor})", st, "  ".join(notes))
+        if st == FAIL:
+            cursor_ok = False
+
+    return cursor_ok
+
+
 def run_test(api_base: str, verbose: bool = False) -> bool:
+    # One worker per simulated node, reused by every concurrent phase so each
+    # worker's keep-alive connection carries over between sections.
+    with ThreadPoolExecutor(max_workers=4, thread_name_prefix="relay-node") as pool:
+        return _run_sections(api_base, pool, verbose)
+
+
+def _run_sections(api_base: str, pool: ThreadPoolExecutor, verbose: bool) -> bool:
     api_base = api_base.rstrip("/")
+    relay = Relay.parse(api_base)
     overall = True
 
     print(f"\nFelund relay integration test")
@@ -209,7 +525,7 @@ def run_test(api_base: str, verbose: bool = False) -> bool:
     # ── 1. Health check ───────────────────────────────────────────
     section("1 / 6  Health check")
     try:
-        h = api_call("GET", f"{api_base}/v1/health")
+        h = api_call("GET", relay, "/v1/health")
         version = h.get("version", "?")
         server_time = h.get("time", 0)
         status_line("GET /v1/health", PASS, f"version={version}  server_time={server_time}")
@@ -234,17 +550,15 @@ def run_test(api_base: str, verbose: bool = False) -> bool:
     for n in nodes:
         status_line(n.name, PASS, f"node={n.node_id[:14]}  msg={n.msg_id[:14]}")
 
-    # ── 3. Sequential pushes ───────────────────────────────────────
-    section("3 / 6  Sequential pushes (one at a time)")
-    for n in nodes:
-        push_node(n, api_base)
-        n.push_ok = False  # reset so concurrent test is fresh
+    # ── 3. Batched push ────────────────────────────────────────────
+    section("3 / 6  Batched push (all 4 messages in one request)")
+    push_nodes_batched(nodes, relay)
 
-    seq_ok = all(not n.push_error for n in nodes)
+    batch_ok = all(not n.push_error for n in nodes)
     for n in nodes:
         st = PASS if not n.push_error else FAIL
         status_line(n.name, st, f"{n.push_ms:.0f} ms  {n.push_error or ''}")
-    if not seq_ok:
+    if not batch_ok:
         overall = False
 
     # Reset push state for the concurrent round
@@ -255,13 +569,9 @@ def run_test(api_base: str, verbose: bool = False) -> bool:
 
     # ── 4. Concurrent pushes ───────────────────────────────────────
     section("4 / 6  Concurrent pushes (all 4 nodes simultaneously)")
-    threads = [threading.Thread(target=push_node, args=(n, api_base)) for n in nodes]
-    t_start = time.monotonic()
-    for t in threads:
-        t.start()
-    for t in threads:
-        t.join()
-    total_ms = (time.monotonic() - t_start) * 1000
+    t_start = time.monotonic_ns()
+    list(pool.map(lambda n: push_node(n, relay), nodes))
+    total_ms = (time.monotonic_ns() - t_start) / 1_000_000
 
     conc_ok = all(not n.push_error for n in nodes)
     for n in nodes:
@@ -279,36 +589,18 @@ def run_test(api_base: str, verbose: bool = False) -> bool:
     section("5 / 6  Pull & MAC verification (since=0)")
     expected_ids = {n.msg_id for n in nodes}
 
-    pull_threads = [threading.Thread(target=pull_node, args=(n, api_base, 0)) for n in nodes]
-    for t in pull_threads:
-        t.start()
-    for t in pull_threads:
-        t.join()
+    list(pool.map(lambda n: pull_node(n, relay, 0), nodes))
+    # HMAC-SHA256 releases the GIL, so the nodes' checks run in parallel.
+    verified = list(pool.map(lambda n: verify_node(n, expected_ids), nodes))
 
     pull_overall = True
-    for n in nodes:
+    for n, (our_msgs, missing, mac_fails) in zip(nodes, verified):
         if n.pull_error:
             status_line(n.name, FAIL, f"pull error: {n.pull_error}")
             pull_overall = False
             overall = False
             continue
 
-        our_msgs = [m for m in n.pull_msgs if m.get("circle_id") == circle_id]
-        received_ids = {m["msg_id"] for m in our_msgs}
-        missing = expected_ids - received_ids
-
-        mac_fails: List[str] = []
-        for m in our_msgs:
-            if m["msg_id"] not in expected_ids:
-                continue  # older msgs from prior test runs, skip
-            expected_mac = make_mac(
-                secret_hex,
-                m["msg_id"], m["circle_id"], m["channel_id"],
-                m["author_node_id"], m["display_name"], m["created_ts"], m["text"],
-            )
-            if expected_mac != m.get("mac", ""):
-                mac_fails.append(m["msg_id"][:10])
-
         extra = len(our_msgs) - len(expected_ids)
         notes: List[str] = [f"{n.pull_ms:.0f} ms", f"got={len(our_msgs)}"]
         if extra > 0:
@@ -336,61 +628,7 @@ def run_test(api_base: str, verbose: bool = False) -> bool:
     # ── 6. Cursor test ─────────────────────────────────────────────
     section("6 / 6  Cursor test (new messages appear after cursor)")
 
-    # Record server time as the cursor BEFORE pushing new messages
-    h2 = api_call("GET", f"{api_base}/v1/health")
-    cursor = int(h2.get("time", 0))
-    status_line("cursor captured", PASS, f"cursor={cursor}")
-
-    # Wait 1 s to guarantee stored_at > cursor
-    time.sleep(1)
-
-    cursor_nodes = [
-        make_node("cursor-A", secret_hex, circle_id, hint),
-        make_node("cursor-B", secret_hex, circle_id, hint),
-    ]
-    cthreads = [threading.Thread(target=push_node, args=(cn, api_base)) for cn in cursor_nodes]
-    for t in cthreads:
-        t.start()
-    for t in cthreads:
-        t.join()
-
-    push_status = PASS if all(not cn.push_error for cn in cursor_nodes) else FAIL
-    status_line("push 2 new msgs", push_status, "  ".join(
-        f"{cn.name}={cn.push_ms:.0f}ms {'ERR:'+cn.push_error if cn.push_error else 'ok'}"
-        for cn in cursor_nodes
-    ))
-    if push_status == FAIL:
-        overall = False
-
-    expected_new = {cn.msg_id for cn in cursor_nodes}
-
-    cursor_ok = True
-    for n in nodes[:2]:  # test from two original nodes' perspectives
-        pull_node(n, api_base, since=cursor)
-        if n.pull_error:
-            status_line(f"{n.name} (since={cursor})", FAIL, n.pull_error)
-            cursor_ok = False
-            continue
-
-        our_new = {m["msg_id"] for m in n.pull_msgs if m.get("circle_id") == circle_id}
-        missing_new = expected_new - our_new
-        old_leaked = expected_ids & our_new  # original msgs should NOT appear
-
-        notes = [f"got={len(n.pull_msgs)}"]
-        st = PASS
-        if missing_new:
-            notes.append(f"MISSING_NEW={[i[:10] for i in missing_new]}")
-            st = FAIL
-        if old_leaked:
-            # This means the cursor didn't filter — server bug
-            notes.append(f"OLD_MSGS_LEAKED={[i[:10] for i in old_leaked]}")
-            st = FAIL
-
-        status_line(f"{n.name} (since={cursor})", st, "  ".join(notes))
-        if st == FAIL:
-            cursor_ok = False
-
-    if not cursor_ok:
+    if not _cursor_section(relay, pool, nodes, expected_ids, secret_hex, circle_id, hint):
         overall = False
 
     # ── Summary ───────────────────────────────────────────────────